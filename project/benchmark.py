@@ -0,0 +1,369 @@
+#benchmark.py
+"""Seed a synthetic dataset and measure per-endpoint latency, throughput and queries per request.
+
+    python benchmark.py --database-url sqlite:////tmp/bench.db seed --faculties 100 --activities-per-faculty 100
+    export BENCHMARK_ADMIN_PASSWORD=...   # printed by seed, or the --admin-password given to it
+    python benchmark.py --database-url sqlite:////tmp/bench.db run --requests 200 --output results.json
+    python benchmark.py compare baseline.json results.json
+
+A login storm at the start of term, checked against a latency budget:
+
+    python benchmark.py run --only login,login_admin,login_failed --requests 400 --concurrency 8 --budget login=250
+
+`run` drives the app in-process through Flask's test client, or a live server with --base-url
+(e.g. gunicorn against a local MySQL container). Queries per request are read from the
+Server-Timing header the app adds to every response.
+
+Against a local database every query is nearly free; --query-delay-ms adds a fixed round trip
+to each statement to show what a networked database costs, e.g. comparing sequential and
+concurrent page queries (DASHBOARD_CACHE_TTL=0 makes every admin dashboard request load its data):
+
+    export DASHBOARD_CACHE_TTL=0
+    python benchmark.py run --only index,facultydashboard --query-delay-ms 5 --output sequential.json
+    PAGE_QUERY_THREADS=4 python benchmark.py run --only index,facultydashboard --query-delay-ms 5 --output concurrent.json
+    python benchmark.py compare sequential.json concurrent.json
+"""
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import re
+import secrets
+import statistics
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import event, func, insert, select
+from sqlalchemy.engine import Engine
+
+ACTIVITY_TYPES = [('Workshop', 'Teaching'), ('Seminar', 'Teaching'), ('Research', 'Research'),
+                  ('Conference', 'Research'), ('Publication', 'Research'), ('Other', 'Service')]
+FIRST_NAMES = ['Anita', 'Bharath', 'Chitra', 'Deepak', 'Esha', 'Farhan', 'Gowri', 'Harish', 'Indu', 'Jayant']
+DEPARTMENTS = ['ISE', 'CSE', 'ECE', 'ME', 'CIV']
+DESIGNATIONS = ['Professor', 'Associate Professor', 'Assistant Professor']
+RATINGS = ['Excellent', 'Good', 'Average', 'Poor']
+STATUSES = ['Completed', 'Pending', 'In Progress']
+INSERT_CHUNK = 5000
+
+
+def load_app(database_url):
+    # app.py reads DATABASE_URL at import time.
+    if database_url:
+        os.environ['DATABASE_URL'] = database_url
+    # The in-process app only needs a key for this run's own sessions.
+    os.environ.setdefault('SECRET_KEY', secrets.token_hex(32))
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+    import app
+    return app
+
+
+def inject_query_delay(delay_ms):
+    # Sleeping releases the GIL, like waiting on a socket, so concurrent queries overlap their delays.
+    event.listen(Engine, 'before_cursor_execute', lambda *args: time.sleep(delay_ms / 1000))
+
+
+def faculty_phone(faculty_id):
+    return f"9{faculty_id:09d}"
+
+
+def insert_chunked(app_module, model, rows):
+    db = app_module.db
+    for start in range(0, len(rows), INSERT_CHUNK):
+        db.session.execute(insert(model), rows[start:start + INSERT_CHUNK])
+        db.session.commit()
+
+
+def seed(app_module, args):
+    rng = random.Random(args.seed)
+    A, db = app_module, app_module.db
+    started = time.perf_counter()
+    with A.app.app_context():
+        db.create_all()
+        # Synthetic faculties all use @bench.local addresses; anything else means this is somebody's real data.
+        if db.session.query(A.Faculty.ID).filter(A.Faculty.Email.is_(None) | ~A.Faculty.Email.like('%@bench.local')).first() is not None:
+            sys.exit('Refusing to seed: the database already holds non-benchmark faculty records. Point --database-url at a scratch database.')
+        years = {y.YearStart: y.ID for y in A.AcademicYear.query.all()}
+        for start in range(args.first_year, args.first_year + args.years):
+            if start not in years:
+                year = A.AcademicYear(YearStart=start, YearEnd=start + 1); db.session.add(year); db.session.flush(); years[start] = year.ID
+        types = {t.Name: t.ID for t in A.ActivityType.query.all()}
+        for name, category in ACTIVITY_TYPES:
+            if name not in types:
+                activity_type = A.ActivityType(Name=name, Category=category); db.session.add(activity_type); db.session.flush(); types[name] = activity_type.ID
+        db.session.commit()
+        year_items, type_ids = sorted(years.items()), list(types.values())
+
+        first_id = (db.session.execute(select(func.max(A.Faculty.ID))).scalar() or 0) + 1
+        faculty_ids = list(range(first_id, first_id + args.faculties))
+        insert_chunked(A, A.Faculty, [dict(
+            ID=fid, FirstName=f"{rng.choice(FIRST_NAMES)}{fid}", LastName=rng.choice(['Rao', 'Shetty', 'Iyer', 'Khan', None]),
+            DOB=date(1960, 1, 1) + timedelta(days=rng.randrange(12000)), Email=f"faculty{fid}@bench.local",
+            Phone=faculty_phone(fid), Department=rng.choice(DEPARTMENTS), Designation=rng.choice(DESIGNATIONS),
+            JoinDate=date(2000, 1, 1) + timedelta(days=rng.randrange(8000))) for fid in faculty_ids])
+
+        activities = []
+        for fid in faculty_ids:
+            for n in range(args.activities_per_faculty):
+                year_start, year_id = rng.choice(year_items)
+                activities.append(dict(
+                    Name=f"Activity {n}", Title=f"{rng.choice(['Intro to', 'Advances in', 'Workshop on', 'Survey of'])} topic {rng.randrange(10000)}",
+                    Date=date(year_start, 7, 1) + timedelta(days=rng.randrange(365)), Description='Synthetic benchmark activity.',
+                    AcademicYearID=year_id, FacultyID=fid, ActivityTypeID=rng.choice(type_ids)))
+                if len(activities) >= INSERT_CHUNK:
+                    insert_chunked(A, A.Activity, activities); activities = []
+        insert_chunked(A, A.Activity, activities)
+
+        code_base = db.session.query(A.Subject).count()
+        insert_chunked(A, A.Subject, [dict(
+            CourseCode=f"BN{code_base + i:07d}", SubjectName=f"Subject {code_base + i}", FacultyID=fid,
+            AcademicYearID=rng.choice(year_items)[1]) for i, fid in enumerate(fid for fid in faculty_ids for _ in range(args.subjects_per_faculty))])
+        insert_chunked(A, A.Appraisal, [dict(
+            FacultyID=fid, AcademicYearID=year_id, Date=date(year_start + 1, 5, 1) + timedelta(days=rng.randrange(60)),
+            Rating=rng.choice(RATINGS), Status=rng.choice(STATUSES), Comments='Synthetic appraisal.')
+            for fid in faculty_ids for year_start, year_id in rng.sample(year_items, min(args.appraisals_per_faculty, len(year_items)))])
+        if db.session.get(A.Credential, 'admin') is None:
+            # Benchmark-only admin account; real deployments create theirs with `flask set-password`.
+            password = args.admin_password or secrets.token_urlsafe(12)
+            db.session.add(A.Credential(Username='admin', PasswordHash=A.hash_password(password), Role='admin'))
+            db.session.commit()
+            if not args.admin_password: print(f"Created benchmark admin with password {password}")
+    A.app.test_cli_runner().invoke(args=['rebuild-activity-stats'])
+    A.app.test_cli_runner().invoke(args=['rebuild-search-index'])
+    print(f"Seeded {args.faculties} faculties, {args.faculties * args.activities_per_faculty} activities "
+          f"in {time.perf_counter() - started:.1f}s.")
+
+
+class InProcessClient:
+    def __init__(self, app_module):
+        self.client = app_module.app.test_client()
+
+    def request(self, method, path, data=None):
+        response = self.client.open(path, method=method, data=data)
+        response.close()
+        return response.status_code, response.headers.get('Server-Timing', ''), response.headers.get('Location', '')
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpClient:
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip('/')
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect())
+
+    def request(self, method, path, data=None):
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        try:
+            with self.opener.open(urllib.request.Request(self.base_url + path, data=body, method=method)) as response:
+                response.read()
+                return response.status, response.headers.get('Server-Timing', ''), response.headers.get('Location', '')
+        except urllib.error.HTTPError as e:
+            return e.code, e.headers.get('Server-Timing', ''), e.headers.get('Location', '')
+
+
+def scenario(sample, args_admin_password):
+    """(name, role, method, path builder, form builder) for every route worth measuring."""
+    rng = random.Random()
+    fid = lambda: rng.choice(sample['faculty_ids'])
+    activity_form = lambda: {'activity_name': 'Bench', 'title': 'Benchmark activity', 'date': '2024-01-15', 'description': '',
+                             'academic_year': rng.choice(sample['year_ids']), 'activity_type': rng.choice(sample['type_ids']), 'faculty_id': fid()}
+    appraisal_form = lambda prefix: {f'{prefix}faculty_id': fid(), f'{prefix}academic_year_id': rng.choice(sample['year_ids']),
+                                     f'{prefix}appraisal_date': '2024-05-01', f'{prefix}overall_rating': 'Good', f'{prefix}status': 'Completed', f'{prefix}comments': ''}
+    return [
+        ('login', 'anonymous', 'POST', lambda: '/login', lambda: (lambda f: {'username': str(f), 'password': faculty_phone(f)})(fid())),
+        ('login_admin', 'anonymous', 'POST', lambda: '/login', lambda: {'username': 'admin', 'password': args_admin_password}),
+        ('login_failed', 'anonymous', 'POST', lambda: '/login', lambda: {'username': str(fid()), 'password': 'wrong-password'}),
+        ('index', 'admin', 'GET', lambda: '/admin_dashboard', None),
+        ('faculty', 'admin', 'GET', lambda: '/faculty', None),
+        ('subjects_view', 'admin', 'GET', lambda: '/subjects', None),
+        ('activities_view', 'admin', 'GET', lambda: '/activities', None),
+        ('activities_view_search', 'admin', 'GET', lambda: '/activities?q=topic+12', None),
+        ('search', 'admin', 'GET', lambda: f"/search?q=survey+topic+{rng.randrange(100, 1000)}", None),
+        ('search_suggest', 'admin', 'GET', lambda: f"/search/suggest?q={rng.choice(['in', 'adv', 'wor', 'sur', 'top'])}", None),
+        ('changes', 'admin', 'GET', lambda: '/changes?limit=500', None),
+        ('appraisals', 'admin', 'GET', lambda: '/appraisals', None),
+        ('get_appraisal_data', 'admin', 'GET', lambda: f"/appraisal/get_data/{rng.choice(sample['appraisal_ids'])}", None),
+        ('add_admin_activity', 'admin', 'POST', lambda: '/add_admin_activity', activity_form),
+        ('edit_admin_activity', 'admin', 'POST', lambda: f"/edit_admin_activity/{rng.choice(sample['activity_ids'])}", activity_form),
+        ('add_appraisal', 'admin', 'POST', lambda: '/appraisals', lambda: appraisal_form('')),
+        ('edit_appraisal', 'admin', 'POST', lambda: f"/appraisal/edit/{rng.choice(sample['appraisal_ids'])}", lambda: appraisal_form('edit_')),
+        ('facultydashboard', 'faculty', 'GET', lambda: '/faculty_dashboard', None),
+        ('profile', 'faculty', 'GET', lambda: '/profile', None),
+        ('subjects', 'faculty', 'GET', lambda: '/subject', None),
+        ('activity', 'faculty', 'GET', lambda: '/activity', None),
+        ('add_activity', 'faculty', 'POST', lambda: '/add_activity', activity_form),
+    ]
+
+
+def sample_ids(app_module, limit=1000):
+    A = app_module
+    with A.app.app_context():
+        ids = lambda column: list(A.db.session.execute(select(column).order_by(column.desc()).limit(limit)).scalars())
+        return {'faculty_ids': ids(A.Faculty.ID), 'year_ids': ids(A.AcademicYear.ID), 'type_ids': ids(A.ActivityType.ID),
+                'activity_ids': ids(A.Activity.ID), 'appraisal_ids': ids(A.Appraisal.ID)}
+
+
+def is_error(method, status, location):
+    """4xx/5xx, any redirect of a page view, and any redirect to the login page (a lost or failed session)."""
+    if 300 <= status < 400:
+        return method == 'GET' or urllib.parse.urlsplit(location).path == '/login'
+    return status >= 400
+
+
+def percentile(sorted_values, pct):
+    if not sorted_values: return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run(app_module, args):
+    sample = sample_ids(app_module)
+    if not sample['faculty_ids']:
+        sys.exit('No data to benchmark; run the seed command first.')
+    make_client = (lambda: HttpClient(args.base_url)) if args.base_url else (lambda: InProcessClient(app_module))
+    if args.query_delay_ms:
+        if args.base_url: sys.exit('--query-delay-ms only applies to the in-process app.')
+        inject_query_delay(args.query_delay_ms)
+
+    def logged_in(role):
+        client = make_client()
+        if role == 'anonymous': return client
+        if role == 'admin':
+            credentials, landing = {'username': 'admin', 'password': args.admin_password}, '/admin_dashboard'
+        else:
+            faculty_id = sample['faculty_ids'][0]
+            credentials, landing = {'username': str(faculty_id), 'password': faculty_phone(faculty_id)}, '/faculty_dashboard'
+        # Without a session every request is a cheap redirect to /login, which would pass for a fast success.
+        status, _, location = client.request('POST', '/login', credentials)
+        if status not in (301, 302, 303) or urllib.parse.urlsplit(location).path != landing:
+            sys.exit(f"{role} login failed (status {status}, redirect to {location or 'nowhere'}); check --admin-password and the seeded data.")
+        return client
+
+    results = {}
+    selected = set(args.only.split(',')) if args.only else None
+    scenarios = [s for s in scenario(sample, args.admin_password) if not selected or s[0] in selected]
+    if not args.admin_password and any(role == 'admin' or name == 'login_admin' for name, role, *_ in scenarios):
+        sys.exit('Admin endpoints need --admin-password (or BENCHMARK_ADMIN_PASSWORD); seed prints the one it created.')
+    for name, role, method, path, form in scenarios:
+        clients = [logged_in(role) for _ in range(args.concurrency)]
+        for _ in range(args.warmup):
+            clients[0].request(method, path(), form() if form else None)
+
+        def worker(client, count):
+            timings = []
+            for _ in range(count):
+                started = time.perf_counter()
+                status, server_timing, location = client.request(method, path(), form() if form else None)
+                timings.append((time.perf_counter() - started, is_error(method, status, location), server_timing))
+            return timings
+
+        per_client = [args.requests // args.concurrency + (1 if i < args.requests % args.concurrency else 0) for i in range(args.concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            timings = [t for batch in pool.map(worker, clients, per_client) for t in batch]
+        wall = time.perf_counter() - started
+
+        latencies = sorted(t[0] * 1000 for t in timings)
+        query_counts = [int(m.group(1)) for m in (re.search(r'desc="(\d+) queries"', t[2]) for t in timings) if m]
+        results[name] = {
+            'requests': len(timings), 'errors': sum(1 for t in timings if t[1]),
+            'p50_ms': round(percentile(latencies, 50), 2), 'p95_ms': round(percentile(latencies, 95), 2),
+            'p99_ms': round(percentile(latencies, 99), 2), 'mean_ms': round(statistics.fmean(latencies), 2) if latencies else 0.0,
+            'requests_per_sec': round(len(timings) / wall, 1) if wall else 0.0,
+            'queries_per_request': round(statistics.fmean(query_counts), 2) if query_counts else None,
+        }
+        r = results[name]
+        print(f"{name:<24} p50 {r['p50_ms']:>8.2f}ms  p95 {r['p95_ms']:>8.2f}ms  p99 {r['p99_ms']:>8.2f}ms  "
+              f"{r['requests_per_sec']:>8.1f} req/s  {r['queries_per_request'] if r['queries_per_request'] is not None else '-':>6} q/req  {r['errors']} errors")
+
+    report = {
+        'meta': {'timestamp': datetime.now().isoformat(timespec='seconds'), 'target': args.base_url or 'in-process',
+                 'database': app_module.app.config['SQLALCHEMY_DATABASE_URI'].split('@')[-1],
+                 'requests': args.requests, 'concurrency': args.concurrency, 'query_delay_ms': args.query_delay_ms,
+                 'page_query_threads': app_module.PAGE_QUERY_THREADS,
+                 'faculties': len(sample['faculty_ids'])},
+        'endpoints': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"Results written to {args.output}")
+    over_budget = [f"{name} p95 {results[name]['p95_ms']}ms > {ms}ms" for name, ms in parse_budgets(args.budget)
+                   if name in results and results[name]['p95_ms'] > ms]
+    # Latencies of failed requests say nothing about the route, so a budgeted endpoint with errors fails too.
+    over_budget += [f"{name} had {results[name]['errors']} errors" for name, _ in parse_budgets(args.budget)
+                    if name in results and results[name]['errors']]
+    if over_budget:
+        sys.exit('Latency budget exceeded: ' + '; '.join(over_budget))
+
+
+def parse_budgets(values):
+    budgets = []
+    for value in values:
+        name, _, ms = value.partition('=')
+        try:
+            budgets.append((name, float(ms)))
+        except ValueError:
+            sys.exit(f"Invalid --budget {value!r}; expected endpoint=milliseconds")
+    return budgets
+
+
+def compare(args):
+    with open(args.baseline) as f: baseline = json.load(f)['endpoints']
+    with open(args.candidate) as f: candidate = json.load(f)['endpoints']
+    print(f"{'endpoint':<24} {'p95 before':>11} {'p95 after':>11} {'change':>8}")
+    for name in sorted(set(baseline) & set(candidate)):
+        before, after = baseline[name]['p95_ms'], candidate[name]['p95_ms']
+        change = f"{(after - before) / before * 100:+.1f}%" if before else 'n/a'
+        print(f"{name:<24} {before:>10.2f}ms {after:>10.2f}ms {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--database-url', help='Overrides DATABASE_URL, e.g. sqlite:////tmp/bench.db')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    seed_parser = commands.add_parser('seed', help='Insert a synthetic dataset')
+    seed_parser.add_argument('--faculties', type=int, default=100)
+    seed_parser.add_argument('--activities-per-faculty', type=int, default=100)
+    seed_parser.add_argument('--subjects-per-faculty', type=int, default=3)
+    seed_parser.add_argument('--appraisals-per-faculty', type=int, default=2)
+    seed_parser.add_argument('--first-year', type=int, default=2015)
+    seed_parser.add_argument('--years', type=int, default=10)
+    seed_parser.add_argument('--seed', type=int, default=42, help='Random seed for reproducible data')
+    seed_parser.add_argument('--admin-password', help='Password for the benchmark admin account; generated and printed if omitted')
+
+    run_parser = commands.add_parser('run', help='Benchmark every route')
+    run_parser.add_argument('--requests', type=int, default=100, help='Requests per endpoint')
+    run_parser.add_argument('--concurrency', type=int, default=1)
+    run_parser.add_argument('--warmup', type=int, default=5)
+    run_parser.add_argument('--only', help='Comma-separated endpoint names')
+    run_parser.add_argument('--base-url', help='Benchmark a running server instead of the in-process app')
+    run_parser.add_argument('--admin-password', default=os.environ.get('BENCHMARK_ADMIN_PASSWORD'))
+    run_parser.add_argument('--output', help='Write results as JSON')
+    run_parser.add_argument('--query-delay-ms', type=float, default=0,
+                            help='Simulated network round trip added to every statement (in-process only)')
+    run_parser.add_argument('--budget', action='append', default=[], metavar='ENDPOINT=MS',
+                            help='Fail if the endpoint p95 exceeds this latency, e.g. --budget login=250')
+
+    compare_parser = commands.add_parser('compare', help='Compare two JSON result files')
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('candidate')
+
+    args = parser.parse_args()
+    if args.command == 'compare':
+        return compare(args)
+    app_module = load_app(args.database_url)
+    seed(app_module, args) if args.command == 'seed' else run(app_module, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""baseline schema
+
+Existing databases already have these tables: mark them with `flask db stamp 0001_baseline`
+and then run `flask db upgrade`.
+
+Revision ID: 0001_baseline
+Revises: 
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0001_baseline'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('Faculty',
+        sa.Column('ID', sa.Integer(), nullable=False),
+        sa.Column('FirstName', sa.String(length=50), nullable=False),
+        sa.Column('LastName', sa.String(length=50), nullable=True),
+        sa.Column('DOB', sa.Date(), nullable=False),
+        sa.Column('Email', sa.String(length=100), nullable=False),
+        sa.Column('Phone', sa.String(length=15), nullable=True),
+        sa.Column('Phone1', sa.String(length=15), nullable=True),
+        sa.Column('Department', sa.String(length=100), nullable=False),
+        sa.Column('Designation', sa.String(length=100), nullable=False),
+        sa.Column('JoinDate', sa.Date(), nullable=True),
+        sa.PrimaryKeyConstraint('ID'),
+        sa.UniqueConstraint('Email'),
+        sa.UniqueConstraint('Phone'),
+        sa.UniqueConstraint('Phone1')
+    )
+    op.create_table('AcademicYear',
+        sa.Column('ID', sa.Integer(), nullable=False),
+        sa.Column('YearStart', sa.Integer(), nullable=False),
+        sa.Column('YearEnd', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('ID')
+    )
+    op.create_table('ActivityType',
+        sa.Column('ID', sa.Integer(), nullable=False),
+        sa.Column('Name', sa.String(length=100), nullable=False),
+        sa.Column('Category', sa.String(length=100), nullable=False),
+        sa.PrimaryKeyConstraint('ID'),
+        sa.UniqueConstraint('Name')
+    )
+    op.create_table('Activity',
+        sa.Column('ID', sa.Integer(), nullable=False),
+        sa.Column('Name', sa.String(length=100), nullable=False),
+        sa.Column('Title', sa.String(length=150), nullable=False),
+        sa.Column('Date', sa.Date(), nullable=False),
+        sa.Column('Description', sa.Text(), nullable=True),
+        sa.Column('AcademicYearID', sa.Integer(), nullable=False),
+        sa.Column('FacultyID', sa.Integer(), nullable=False),
+        sa.Column('ActivityTypeID', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['AcademicYearID'], ['AcademicYear.ID']),
+        sa.ForeignKeyConstraint(['ActivityTypeID'], ['ActivityType.ID']),
+        sa.ForeignKeyConstraint(['FacultyID'], ['Faculty.ID']),
+        sa.PrimaryKeyConstraint('ID')
+    )
+    op.create_table('Subject',
+        sa.Column('CourseCode', sa.String(length=10), nullable=False),
+        sa.Column('SubjectName', sa.String(length=100), nullable=False),
+        sa.Column('FacultyID', sa.Integer(), nullable=True),
+        sa.Column('AcademicYearID', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['AcademicYearID'], ['AcademicYear.ID']),
+        sa.ForeignKeyConstraint(['FacultyID'], ['Faculty.ID']),
+        sa.PrimaryKeyConstraint('CourseCode')
+    )
+    op.create_table('Appraisal',
+        sa.Column('ID', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('FacultyID', sa.Integer(), nullable=False),
+        sa.Column('AcademicYearID', sa.Integer(), nullable=False),
+        sa.Column('Date', sa.Date(), nullable=False),
+        sa.Column('Rating', sa.String(length=50), nullable=True),
+        sa.Column('Status', sa.String(length=50), nullable=False),
+        sa.Column('Comments', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['AcademicYearID'], ['AcademicYear.ID']),
+        sa.ForeignKeyConstraint(['FacultyID'], ['Faculty.ID']),
+        sa.PrimaryKeyConstraint('ID')
+    )
+
+
+def downgrade():
+    op.drop_table('Appraisal')
+    op.drop_table('Subject')
+    op.drop_table('Activity')
+    op.drop_table('ActivityType')
+    op.drop_table('AcademicYear')
+    op.drop_table('Faculty')
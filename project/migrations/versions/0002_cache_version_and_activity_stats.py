@@ -0,0 +1,49 @@
+"""cache version stamp and faculty activity statistics
+
+Both tables may already exist on databases set up with `flask init-db`.
+
+Revision ID: 0002_cache_and_stats
+Revises: 0001_baseline
+Create Date: 2026-10-17 12:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0002_cache_and_stats'
+down_revision = '0001_baseline'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'CacheVersion' not in existing:
+        op.create_table('CacheVersion',
+            sa.Column('Name', sa.String(length=50), nullable=False),
+            sa.Column('Version', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('Name')
+        )
+    if 'FacultyActivityStat' not in existing:
+        op.create_table('FacultyActivityStat',
+            sa.Column('FacultyID', sa.Integer(), nullable=False),
+            sa.Column('ActivityTypeID', sa.Integer(), nullable=False),
+            sa.Column('AcademicYearID', sa.Integer(), nullable=False),
+            sa.Column('ActivityCount', sa.Integer(), nullable=False),
+            sa.Column('LatestDate', sa.Date(), nullable=True),
+            sa.ForeignKeyConstraint(['AcademicYearID'], ['AcademicYear.ID']),
+            sa.ForeignKeyConstraint(['ActivityTypeID'], ['ActivityType.ID']),
+            sa.ForeignKeyConstraint(['FacultyID'], ['Faculty.ID']),
+            sa.PrimaryKeyConstraint('FacultyID', 'ActivityTypeID', 'AcademicYearID')
+        )
+        # Backfill, equivalent to `flask rebuild-activity-stats`.
+        op.execute('INSERT INTO FacultyActivityStat (FacultyID, ActivityTypeID, AcademicYearID, ActivityCount, LatestDate) '
+                   'SELECT FacultyID, ActivityTypeID, AcademicYearID, COUNT(ID), MAX(Date) FROM Activity '
+                   'GROUP BY FacultyID, ActivityTypeID, AcademicYearID')
+
+
+def downgrade():
+    op.drop_table('FacultyActivityStat')
+    op.drop_table('CacheVersion')
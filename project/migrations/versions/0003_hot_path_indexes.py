@@ -0,0 +1,38 @@
+"""secondary indexes for the hot query paths
+
+Revision ID: 0003_hot_path_indexes
+Revises: 0002_cache_and_stats
+Create Date: 2026-10-17 12:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0003_hot_path_indexes'
+down_revision = '0002_cache_and_stats'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('ix_Activity_Date_ID', 'Activity', ['Date', 'ID']),
+    ('ix_Activity_FacultyID_Date', 'Activity', ['FacultyID', sa.text('Date DESC')]),
+    ('ix_Activity_AcademicYearID_Date_ID', 'Activity', ['AcademicYearID', 'Date', 'ID']),
+    ('ix_Activity_ActivityTypeID_Date_ID', 'Activity', ['ActivityTypeID', 'Date', 'ID']),
+    ('ix_Activity_Faculty_Type_Year', 'Activity', ['FacultyID', 'ActivityTypeID', 'AcademicYearID']),
+    ('ix_Appraisal_Date_ID', 'Appraisal', ['Date', 'ID']),
+    ('ix_Appraisal_FacultyID', 'Appraisal', ['FacultyID']),
+    ('ix_Subject_FacultyID', 'Subject', ['FacultyID']),
+    ('ix_Faculty_FirstName_LastName', 'Faculty', ['FirstName', 'LastName']),
+]
+
+
+def upgrade():
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,31 @@
+"""hashed credential store
+
+Revision ID: 0004_credentials
+Revises: 0003_hot_path_indexes
+Create Date: 2026-10-17 12:15:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004_credentials'
+down_revision = '0003_hot_path_indexes'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('Credential',
+        sa.Column('Username', sa.String(length=50), nullable=False),
+        sa.Column('PasswordHash', sa.String(length=255), nullable=False),
+        sa.Column('Role', sa.String(length=20), nullable=False),
+        sa.Column('FacultyID', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['FacultyID'], ['Faculty.ID']),
+        sa.PrimaryKeyConstraint('Username')
+    )
+
+
+def downgrade():
+    op.drop_table('Credential')
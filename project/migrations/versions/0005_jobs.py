@@ -0,0 +1,41 @@
+"""background job queue
+
+Revision ID: 0005_jobs
+Revises: 0004_credentials
+Create Date: 2026-10-17 12:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005_jobs'
+down_revision = '0004_credentials'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('Job',
+        sa.Column('ID', sa.Integer(), nullable=False),
+        sa.Column('Name', sa.String(length=50), nullable=False),
+        sa.Column('Payload', sa.Text(), nullable=False),
+        sa.Column('Status', sa.String(length=20), nullable=False),
+        sa.Column('Attempts', sa.Integer(), nullable=False),
+        sa.Column('MaxAttempts', sa.Integer(), nullable=False),
+        sa.Column('RunAfter', sa.DateTime(), nullable=False),
+        sa.Column('CreatedAt', sa.DateTime(), nullable=False),
+        sa.Column('StartedAt', sa.DateTime(), nullable=True),
+        sa.Column('FinishedAt', sa.DateTime(), nullable=True),
+        sa.Column('LockedBy', sa.String(length=100), nullable=True),
+        sa.Column('Result', sa.Text(), nullable=True),
+        sa.Column('Error', sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint('ID')
+    )
+    op.create_index('ix_Job_Status_RunAfter', 'Job', ['Status', 'RunAfter'])
+
+
+def downgrade():
+    op.drop_index('ix_Job_Status_RunAfter', table_name='Job')
+    op.drop_table('Job')
@@ -0,0 +1,41 @@
+"""full-text search index
+
+Revision ID: 0006_search_index
+Revises: 0005_jobs
+Create Date: 2026-10-17 13:05:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0006_search_index'
+down_revision = '0005_jobs'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('SearchTerm',
+        sa.Column('EntityType', sa.String(length=20), nullable=False),
+        sa.Column('Term', sa.String(length=40), nullable=False),
+        sa.Column('EntityID', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('Weight', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('EntityType', 'Term', 'EntityID')
+    )
+    op.create_index('ix_SearchTerm_Entity', 'SearchTerm', ['EntityType', 'EntityID'])
+    op.create_table('SearchVocabulary',
+        sa.Column('Term', sa.String(length=40), nullable=False),
+        sa.Column('DocCount', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('Term')
+    )
+    op.create_index('ix_SearchVocabulary_DocCount', 'SearchVocabulary', ['DocCount'])
+    # Existing rows are indexed by `flask rebuild-search-index`.
+
+
+def downgrade():
+    op.drop_index('ix_SearchVocabulary_DocCount', table_name='SearchVocabulary')
+    op.drop_table('SearchVocabulary')
+    op.drop_index('ix_SearchTerm_Entity', table_name='SearchTerm')
+    op.drop_table('SearchTerm')
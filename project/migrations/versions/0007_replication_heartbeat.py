@@ -0,0 +1,28 @@
+"""replication heartbeat
+
+Revision ID: 0007_replication_heartbeat
+Revises: 0006_search_index
+Create Date: 2026-10-17 15:10:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0007_replication_heartbeat'
+down_revision = '0006_search_index'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('Heartbeat',
+        sa.Column('Name', sa.String(length=50), nullable=False),
+        sa.Column('BeatAtMs', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('Name')
+    )
+
+
+def downgrade():
+    op.drop_table('Heartbeat')
@@ -0,0 +1,34 @@
+"""change log
+
+Revision ID: 0008_change_log
+Revises: 0007_replication_heartbeat
+Create Date: 2026-10-17 16:40:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0008_change_log'
+down_revision = '0007_replication_heartbeat'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ChangeLog',
+        sa.Column('Sequence', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('Entity', sa.String(length=30), nullable=False),
+        sa.Column('EntityKey', sa.String(length=20), nullable=False),
+        sa.Column('Operation', sa.String(length=10), nullable=False),
+        sa.Column('ChangedColumns', sa.Text(), nullable=True),
+        sa.Column('ChangedAt', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('Sequence')
+    )
+    op.create_index('ix_ChangeLog_Entity_Sequence', 'ChangeLog', ['Entity', 'Sequence'], unique=False)
+
+
+def downgrade():
+    op.drop_index('ix_ChangeLog_Entity_Sequence', table_name='ChangeLog')
+    op.drop_table('ChangeLog')
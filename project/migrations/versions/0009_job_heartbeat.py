@@ -0,0 +1,24 @@
+"""job heartbeat
+
+Revision ID: 0009_job_heartbeat
+Revises: 0008_change_log
+Create Date: 2026-10-17 19:20:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0009_job_heartbeat'
+down_revision = '0008_change_log'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('Job', sa.Column('HeartbeatAt', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    op.drop_column('Job', 'HeartbeatAt')
@@ -0,0 +1,45 @@
+import os
+import sys
+import tempfile
+from datetime import date
+
+import pytest
+
+# app.py reads its configuration at import time, so point it at a throwaway SQLite database first.
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'test.db')
+os.environ['PAGE_CACHE_BACKEND'] = 'none'
+os.environ['SECRET_KEY'] = 'test-secret-key'
+os.environ.pop('DATABASE_REPLICA_URLS', None)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture
+def A():
+    """The app module with an empty schema; every test starts from a fresh database and cold caches."""
+    with app_module.app.app_context():
+        app_module.db.create_all()
+        yield app_module
+        app_module.db.session.remove()
+        app_module.db.drop_all()
+    app_module.dashboard_snapshot.invalidate()
+    app_module.reference_cache.invalidate()
+    app_module.identity_cache.invalidate()
+
+
+@pytest.fixture
+def faculty(A):
+    member = A.Faculty(FirstName='Asha', LastName='K', DOB=date(1980, 1, 1), Email='asha@example.edu', Phone='9000000001',
+                       Department='ISE', Designation='Professor')
+    A.db.session.add(member); A.db.session.commit()
+    return member
+
+
+@pytest.fixture
+def admin_client(A):
+    client = A.app.test_client()
+    with client.session_transaction() as sess:
+        sess['user_type'] = 'admin'
+        sess['user_id'] = 'admin'
+    return client
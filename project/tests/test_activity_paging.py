@@ -0,0 +1,69 @@
+from datetime import date
+
+import pytest
+from flask import template_rendered
+
+
+@pytest.fixture
+def activities(A, faculty):
+    year = A.AcademicYear(YearStart=2023, YearEnd=2024)
+    activity_type = A.ActivityType(Name='Workshop', Category='Teaching')
+    A.db.session.add_all([year, activity_type]); A.db.session.flush()
+    # Several activities per date, so pages have to break ties on ID.
+    rows = [A.Activity(Name=f'Activity {n}', Title=f'Title {n}', Date=date(2023, 8, 1 + n % 20), AcademicYearID=year.ID,
+                       FacultyID=faculty.ID, ActivityTypeID=activity_type.ID) for n in range(2 * A.ACTIVITIES_PER_PAGE + 10)]
+    A.db.session.add_all(rows); A.db.session.commit()
+    return sorted(((a.Date, a.ID) for a in rows), reverse=True)
+
+
+@pytest.fixture
+def render(A, admin_client):
+    """GET an /activities URL and return the (date, id) keys it listed and its pagination links."""
+    def get(url):
+        captured = []
+        def record(sender, template, context, **extra): captured.append(context)
+        with template_rendered.connected_to(record, A.app):
+            assert admin_client.get(url).status_code == 200
+        context = captured[-1]
+        return [(a.Date, a.ID) for a in context['activities']], context['pagination']
+    return get
+
+
+def test_cursor_round_trip(A):
+    token = A.encode_activity_cursor(date(2023, 8, 5), 42)
+    assert A.decode_activity_cursor(token) == (date(2023, 8, 5), 42)
+
+
+@pytest.mark.parametrize('token', [None, '', 'garbage', '2023-08-05', '2023-13-01_4', '2023-08-05_x'])
+def test_malformed_cursor_is_no_cursor(A, token):
+    assert A.decode_activity_cursor(token) is None
+
+
+def test_next_pages_list_every_activity_once_in_order(activities, render):
+    seen, url, pages = [], '/activities', 0
+    while url:
+        keys, pagination = render(url)
+        seen += keys
+        url, pages = pagination['next_url'], pages + 1
+    assert seen == activities
+    assert pages == 3
+
+
+def test_prev_links_return_the_same_pages(activities, render):
+    first, pagination = render('/activities')
+    second, pagination = render(pagination['next_url'])
+    last, pagination = render(pagination['next_url'])
+    assert pagination['next_url'] is None
+
+    back, pagination = render(pagination['prev_url'])
+    assert back == second
+    back, pagination = render(pagination['prev_url'])
+    assert back == first
+    assert pagination['prev_url'] is None
+
+
+def test_cursor_paging_keeps_filters(A, activities, render):
+    _, pagination = render('/activities?year=1')
+    assert 'year=1' in pagination['next_url']
+    keys, _ = render('/activities?year=1&after=garbage')
+    assert keys == activities[:A.ACTIVITIES_PER_PAGE]
@@ -0,0 +1,43 @@
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+def test_outdated_hash_is_upgraded_on_login(A):
+    A.db.session.add(A.Credential(Username='admin', PasswordHash=generate_password_hash('secret', method='pbkdf2:sha256:1000'), Role='admin'))
+    A.db.session.commit()
+
+    assert A.authenticate('admin', 'secret') == ('admin', 'admin')
+    stored = A.db.session.get(A.Credential, 'admin').PasswordHash
+    assert stored.split('$', 1)[0] == A.PASSWORD_HASH_METHOD
+    assert check_password_hash(stored, 'secret')
+
+
+def test_wrong_password_keeps_hash(A):
+    old_hash = generate_password_hash('secret', method='pbkdf2:sha256:1000')
+    A.db.session.add(A.Credential(Username='admin', PasswordHash=old_hash, Role='admin'))
+    A.db.session.commit()
+
+    assert A.authenticate('admin', 'wrong') is None
+    assert A.db.session.get(A.Credential, 'admin').PasswordHash == old_hash
+
+
+def test_unknown_user_still_checks_a_hash(A, monkeypatch):
+    checked = []
+    monkeypatch.setattr(A, 'check_password_hash', lambda pwhash, password: checked.append(pwhash) or False)
+
+    assert A.authenticate('nobody', 'guess') is None
+    assert checked == [A._UNKNOWN_USER_HASH]
+
+
+def test_phone_login_stores_a_credential(A, faculty):
+    assert A.authenticate(str(faculty.ID), 'wrong') is None
+    assert A.db.session.get(A.Credential, str(faculty.ID)) is None
+
+    assert A.authenticate(str(faculty.ID), faculty.Phone) == ('faculty', faculty.ID)
+    credential = A.db.session.get(A.Credential, str(faculty.ID))
+    assert (credential.Role, credential.FacultyID) == ('faculty', faculty.ID)
+    assert check_password_hash(credential.PasswordHash, faculty.Phone)
+
+    # Later logins go through the stored hash, not the phone number on file.
+    faculty.Phone = '9000000002'; A.db.session.commit()
+    assert A.authenticate(str(faculty.ID), '9000000001') == ('faculty', faculty.ID)
+    assert A.authenticate(str(faculty.ID), '9000000002') is None
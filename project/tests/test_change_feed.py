@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+
+def row(sequence, operation, key='1', columns=None, entity='faculty'):
+    return SimpleNamespace(Sequence=sequence, Entity=entity, EntityKey=key, Operation=operation,
+                           ChangedColumns=json.dumps(columns) if columns else None, ChangedAt=datetime(2024, 1, 1))
+
+
+@pytest.fixture
+def academic_year(A):
+    year = A.AcademicYear(YearStart=2023, YearEnd=2024)
+    A.db.session.add(year); A.db.session.commit()
+    return year
+
+
+def test_compact_merges_updates_into_last_sequence(A):
+    [change] = A.compact_changes([row(1, 'update', columns=['Email']), row(2, 'update', columns=['Phone'])])
+    assert (change['operation'], change['sequence'], change['columns']) == ('update', 2, {'Email', 'Phone'})
+
+
+def test_compact_keeps_insert_of_record_updated_in_batch(A):
+    [change] = A.compact_changes([row(1, 'insert'), row(2, 'update', columns=['Email'])])
+    assert (change['operation'], change['sequence']) == ('insert', 2)
+
+
+def test_compact_drops_record_created_and_deleted_in_batch(A):
+    assert A.compact_changes([row(1, 'insert'), row(2, 'update', columns=['Email']), row(3, 'delete')]) == []
+
+
+def test_compact_delete_supersedes_earlier_updates(A):
+    [change] = A.compact_changes([row(1, 'update', columns=['Email']), row(2, 'delete')])
+    assert (change['operation'], change['columns']) == ('delete', set())
+
+
+def test_compact_orders_by_last_change(A):
+    changes = A.compact_changes([row(1, 'update', key='1', columns=['Email']), row(2, 'update', key='2', columns=['Email']),
+                                 row(3, 'update', key='1', columns=['Phone'])])
+    assert [(c['key'], c['sequence']) for c in changes] == [('2', 2), ('1', 3)]
+
+
+def test_feed_pages_cover_every_change_once(A, admin_client, academic_year):
+    for start in range(2024, 2029):
+        A.db.session.add(A.AcademicYear(YearStart=start, YearEnd=start + 1)); A.db.session.commit()
+    head = int(admin_client.get('/changes').get_json()['head'])
+    assert head == 6
+
+    seen, since = [], '0'
+    while True:
+        page = admin_client.get(f'/changes?since={since}&limit=2').get_json()
+        seen += [c['sequence'] for c in page['changes']]
+        assert page['head'] == str(head)
+        since = page['next']
+        if not page['has_more']: break
+    assert seen == list(range(1, head + 1))
+    assert since == str(head)
+
+    # Reading from head returns nothing and keeps the token, until the next commit.
+    assert admin_client.get(f'/changes?since={head}').get_json() == {'changes': [], 'next': str(head), 'head': str(head), 'has_more': False}
+    academic_year.YearEnd = 2025; A.db.session.commit()
+    [change] = admin_client.get(f'/changes?since={head}').get_json()['changes']
+    assert (change['sequence'], change['operation'], change['changed']) == (head + 1, 'update', ['year_end'])
+
+
+def test_pruned_tokens_get_410_from_the_horizon_down(A, admin_client, academic_year):
+    A.db.session.add(A.AcademicYear(YearStart=2030, YearEnd=2031)); A.db.session.commit()
+    assert A.prune_change_log(datetime.now() + timedelta(days=1)) == 2
+
+    assert admin_client.get('/changes?since=1').status_code == 410
+    response = admin_client.get('/changes?since=2')
+    assert response.status_code == 200 and response.get_json()['changes'] == []
@@ -0,0 +1,57 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import event, insert
+
+
+def faculty_row(n):
+    return {'first_name': f'Imported{n}', 'dob': '1985-01-01', 'email': f'imported{n}@example.edu', 'phone': f'80000000{n:02d}',
+            'department': 'ISE', 'designation': 'Professor'}
+
+
+@pytest.fixture(params=['returning', 'match_values'])
+def insert_path(request, A, monkeypatch):
+    if request.param == 'match_values':  # What MySQL does: no RETURNING with executemany.
+        monkeypatch.setattr(A.db.engine.dialect, 'insert_executemany_returning', False)
+    return request.param
+
+
+@pytest.fixture
+def concurrent_insert(A):
+    """Another session adds a faculty member just before the import's first INSERT into Faculty."""
+    done = []
+    def before_insert(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith('INSERT INTO "Faculty"') and not done:
+            done.append(True)
+            with A.db.engine.begin() as other:
+                other.execute(insert(A.Faculty).values(FirstName='Other', DOB=date(1990, 1, 1), Email='other@example.edu',
+                                                       Department='CSE', Designation='Lecturer'))
+    event.listen(A.db.engine, 'before_cursor_execute', before_insert)
+    yield
+    event.remove(A.db.engine, 'before_cursor_execute', before_insert)
+
+
+def logged_inserts(A):
+    rows = A.db.session.execute(A.select(A.ChangeLog.EntityKey).where(A.ChangeLog.Operation == 'insert')).scalars().all()
+    return sorted(int(key) for key in rows)
+
+
+def imported_ids(A):
+    return sorted(A.db.session.execute(A.select(A.Faculty.ID).where(A.Faculty.FirstName.like('Imported%'))).scalars())
+
+
+def test_import_logs_only_its_own_rows(A, insert_path, concurrent_insert):
+    report = A.import_rows('faculty', iter([faculty_row(n) for n in range(5)]))
+
+    assert report['inserted'] == 5
+    other = A.db.session.execute(A.select(A.Faculty.ID).where(A.Faculty.Email == 'other@example.edu')).scalar()
+    assert other is not None
+    assert logged_inserts(A) == imported_ids(A)
+
+
+def test_row_by_row_retry_logs_only_inserted_rows(A, insert_path):
+    rows = [faculty_row(1), faculty_row(2), dict(faculty_row(3), email='imported1@example.edu')]
+    report = A.import_rows('faculty', iter(rows))
+
+    assert (report['inserted'], report['failed']) == (2, 1)
+    assert logged_inserts(A) == imported_ids(A)
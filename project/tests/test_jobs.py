@@ -0,0 +1,43 @@
+import time
+from datetime import datetime, timedelta
+
+
+def running_job(A, started_minutes_ago, heartbeat_minutes_ago, attempts):
+    now = datetime.now()
+    job = A.Job(Name='rebuild_activity_stats', Status='running', LockedBy='dead-worker', Attempts=attempts, MaxAttempts=3,
+                StartedAt=now - timedelta(minutes=started_minutes_ago), HeartbeatAt=now - timedelta(minutes=heartbeat_minutes_ago))
+    A.db.session.add(job); A.db.session.commit()
+    return job.ID
+
+
+def test_abandoned_jobs_are_requeued_until_out_of_attempts(A):
+    retry = running_job(A, 120, 60, attempts=1)
+    last_attempt = running_job(A, 120, 60, attempts=3)
+
+    assert A.requeue_stale_jobs() == (1, 1)
+    retried, failed = A.db.session.get(A.Job, retry), A.db.session.get(A.Job, last_attempt)
+    assert (retried.Status, retried.LockedBy) == ('queued', None)
+    assert (failed.Status, failed.LockedBy) == ('failed', None)
+    assert failed.FinishedAt is not None and failed.Error
+
+
+def test_long_job_with_a_recent_heartbeat_is_left_running(A):
+    job_id = running_job(A, 120, 0, attempts=1)
+
+    assert A.requeue_stale_jobs() == (0, 0)
+    assert A.db.session.get(A.Job, job_id).Status == 'running'
+
+
+def test_running_job_refreshes_its_heartbeat(A, monkeypatch):
+    monkeypatch.setattr(A, 'JOB_HEARTBEAT_INTERVAL', 0.05)
+    monkeypatch.setitem(A.JOB_TASKS, 'slow', lambda job, payload: time.sleep(0.3) or {})
+    job = A.enqueue_job('slow')
+    claimed = A.claim_job('worker-1')
+    started = claimed.HeartbeatAt
+
+    A.run_job(claimed)
+
+    A.db.session.expire_all()
+    job = A.db.session.get(A.Job, job.ID)
+    assert job.Status == 'succeeded'
+    assert job.HeartbeatAt > started
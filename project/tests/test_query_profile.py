@@ -0,0 +1,13 @@
+import re
+
+
+def query_count(response):
+    return int(re.search(r'desc="(\d+) queries"', response.headers['Server-Timing']).group(1))
+
+
+def test_counts_restart_for_each_request_in_a_shared_app_context(A, admin_client, faculty):
+    # The A fixture keeps one app context open, so g is shared by these requests as it is under check-indexes.
+    first = query_count(admin_client.get('/api/v1/faculty'))
+    second = query_count(admin_client.get('/api/v1/faculty'))
+    assert first >= 1
+    assert second == first